@@ -18,12 +18,12 @@ def main():
     # 👷 Preprocessing step
     preprocess_parser = subparsers.add_parser("preprocess", help="Rename and append raw CSVs")
     preprocess_parser.add_argument("--config", required=True, help="Path to config.yaml")
-    preprocess_parser.add_argument("--output", help="Path to output directory for pickled DataFrames")
+    preprocess_parser.add_argument("--output", help="Path to output directory for Feather DataFrames")
     preprocess_parser.add_argument("--summary-json", help="Optional path to export preprocessing summary as JSON", required=False)
 
     # Metrics step
     metrics_parser = subparsers.add_parser("metrics", help="Aggregate project outcomes into a single dataset")
-    metrics_parser.add_argument("--pickles", default=None, help="Optional list of pickle file paths to process")
+    metrics_parser.add_argument("--frames", "--pickles", dest="frames", default=None, help="Optional directory of preprocessed Feather files to process")
     metrics_parser.add_argument("--config", required=True, help="Path to config.yaml")
     metrics_parser.add_argument("--output", help="Path to output directory for aggregated outcomes dataset")
     metrics_parser.add_argument("--summary-json", help="Optional path to export metrics summary as JSON", required=False)
@@ -49,7 +49,7 @@ def main():
         preprocess_dict, preprocess_metadata = preprocess(config_path=args.config, output_path=args.output, summary_path=args.summary_json)
 
     elif args.command == "metrics":
-        metrics_df, metrics_metadata = metrics(pickles = args.pickles, config_path=args.config, output_path=args.output, summary_path=args.summary_json)
+        metrics_df, metrics_metadata = metrics(frames = args.frames, config_path=args.config, output_path=args.output, summary_path=args.summary_json)
 
     elif args.command == "keywords":
         keywords_df, keywords_metadata = keywords(metrics = args.metrics, config_path=args.config, output_path=args.output, summary_path=args.summary_json)
@@ -1,5 +1,10 @@
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader  # LibYAML binding
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 def load_config(config_path: str) -> dict:
     with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
\ No newline at end of file
+        return yaml.load(f, Loader=_Loader)
@@ -1,8 +1,13 @@
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
-import json
 import logging
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+    import json
+
 
 def export_summary_json(
     summary: Dict[str, Any],
@@ -13,6 +18,8 @@ def export_summary_json(
 ) -> Path:
     """
     Exports a summary dictionary to a JSON file.
+    Serialized with orjson (numpy scalars and non-string keys included) when installed,
+    otherwise with the standard json module.
 
     Args:
         summary: Dictionary to export.
@@ -29,8 +36,12 @@ def export_summary_json(
     final_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with open(final_path, "w", encoding="utf-8") as f:
-            json.dump(summary, f, indent=2)
+        if orjson is not None:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            final_path.write_bytes(orjson.dumps(summary, option=options))
+        else:
+            with open(final_path, "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2)
         if logger:
             logger.info(f"Summary JSON exported to: {final_path}")
     except Exception as e:
@@ -38,3 +49,4 @@ def export_summary_json(
             logger.error(f"Failed to export summary JSON: {str(e)}", exc_info=True)
 
     return final_path
+
@@ -2,6 +2,7 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict
 import logging
+from logging.handlers import MemoryHandler
 
 def _resolve_log_path(config: Optional[Dict], timestamp: str) -> Path:
     logs_dir = Path(config.get("logs_dir", "logs")).resolve() if config else Path("logs").resolve()
@@ -48,12 +49,26 @@ def configure_logger(
     logger.setLevel(getattr(logging, loglevel.upper(), logging.INFO))
 
     if logger.hasHandlers():
+        for handler in logger.handlers:
+            # MemoryHandler.close() flushes its buffer but only detaches its FileHandler, so close that too
+            target = handler.target if isinstance(handler, MemoryHandler) else None
+            handler.close()
+            if target:
+                target.close()
         logger.handlers.clear()
 
     formatter = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
 
     if log_to_file:
-        logger.addHandler(_create_handler("file", log_path, formatter, file_mode))
+        file_handler = _create_handler("file", log_path, formatter, file_mode)
+
+        # Batch file writes; a full buffer or an ERROR flushes, and INFO records otherwise wait for
+        # reconfiguration or logging's atexit shutdown, so tail the file with log_buffer_capacity: 0
+        buffer_capacity = config.get("log_buffer_capacity", 0)
+        if buffer_capacity:
+            file_handler = MemoryHandler(buffer_capacity, flushLevel=logging.ERROR, target=file_handler)
+
+        logger.addHandler(file_handler)
 
     if log_to_console:
         logger.addHandler(_create_handler("console", None, formatter))
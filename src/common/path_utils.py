@@ -37,7 +37,7 @@ def resolve_output_path(
 INPUT_PATHS = {
     "metrics": {
         "config_key": "preprocess_dir",
-        "file_glob": "*.pkl"
+        "file_glob": "*.feather"
     },
     "keywords": {
         "config_key": "metrics_dir",
@@ -76,7 +76,7 @@ def resolve_input_files(
 ) -> Union[Dict[str, Path], Path]:
     """
     Resolves either:
-    - a directory of pickle files (for 'metrics')
+    - a directory of Feather files (for 'metrics')
     - a specific CSV file (for 'keywords' or 'mlexport')
     """
     if logger:
@@ -84,7 +84,7 @@ def resolve_input_files(
     input_dir = resolve_input_path(stage, input_path, config, logger)
     stage_map = INPUT_PATHS.get(stage)
 
-    # Multiple pickles (metrics)
+    # Multiple Feather files (metrics)
     if "file_glob" in stage_map:
         file_paths = sorted(input_dir.glob(stage_map["file_glob"]))
         return {p.stem: p for p in file_paths}
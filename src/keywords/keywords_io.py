@@ -45,6 +45,10 @@ def export_keywords_csv(
         Path to saved CSV file
     """
     keywords_path = output_dir / "keywords.csv"
+    # Render matched-term lists as Python list reprs, as keywords.csv always has; to_csv would print Arrow list scalars
+    if "flagged" in keywords_df.columns:
+        # Iterating yields plain Python lists even when the column is Arrow list<string>
+        keywords_df = keywords_df.assign(flagged=[str(terms) for terms in keywords_df["flagged"]])
     keywords_df.to_csv(keywords_path, index=False)
     logger.info(f"Keyword-enriched DataFrame saved to: {keywords_path}")
 
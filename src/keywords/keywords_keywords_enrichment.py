@@ -1,11 +1,16 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 from typing import List, Tuple, Dict, Optional
 from flashtext import KeywordProcessor
-from collections import Counter
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import logging
 
+# Per-process FlashText processor, built by _init_keyword_processor
+_keyword_processor: Optional[KeywordProcessor] = None
+
 def enrich_with_keyword_metrics(
     df: pd.DataFrame,
     config: Dict,
@@ -32,76 +37,118 @@ def enrich_with_keyword_metrics(
             logger.warning("No valid text columns found in DataFrame for enrichment.")
         return df, {}
 
-    # Combine text across columns
-    df["combined_text"] = df[available_cols].apply(
-        lambda row: " | ".join(str(x).lower() for x in row if pd.notnull(x)),
-        axis=1
-    )
+    # Columns are scanned separately, so no combined text column is built; FlashText handles case itself
+    text_columns = [
+        df[col].astype(pd.ArrowDtype(pa.string())).fillna("").tolist()
+        for col in available_cols
+    ]
 
-    # FlashText setup
-    keyword_processor = KeywordProcessor()
-    keyword_processor.add_keywords_from_list([kw.lower() for kw in treatments + diseases])
+    # FlashText setup: each worker process builds its own processor once from the keyword list
+    keyword_list = treatments + diseases
 
-    # Create batches
-    def chunk_series(series: pd.Series, chunk_size: int) -> List[pd.Series]:
-        return [series[i:i + chunk_size] for i in range(0, len(series), chunk_size)]
+    # Create batches as (start row, per-column plain lists of texts) so they pickle cheaply to worker processes
+    def chunk_texts(columns: List[List[str]], chunk_size: int) -> List[Tuple[int, List[List[str]]]]:
+        n_rows = len(columns[0])
+        return [(i, [col[i:i + chunk_size] for col in columns]) for i in range(0, n_rows, chunk_size)]
 
     use_parallel = config.get("parallel", False)
     max_workers = config.get("workers", 4)
     chunk_size = max(1, len(df) // max_workers)
-    chunks = chunk_series(df["combined_text"], chunk_size)
-
-    # Batch processing
-    def process_batch(batch: pd.Series) -> Tuple[List[int], List[int], List[List[str]]]:
-        total, unique, flagged = [], [], []
-        for text in batch:
-            keywords = keyword_processor.extract_keywords(text)
-            total.append(len(keywords))
-            unique.append(len(set(keywords)))
-            flagged.append(list(dict.fromkeys(keywords)))
-        return total, unique, flagged
-
-    # Parallel execution
+    chunks = chunk_texts(text_columns, chunk_size)
+
+    # Parallel execution: extraction is pure Python and holds the GIL, so it needs processes rather than threads
     if use_parallel:
-        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="flash") as executor:
-            results = list(executor.map(process_batch, chunks))
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_keyword_processor,
+            initargs=(keyword_list,)
+        ) as executor:
+            results = list(executor.map(_process_batch, chunks))
 
     # Sequential executionfor environments where concurrency is limited or unnecessary
     else:
-        results = [process_batch(chunk) for chunk in chunks]
-
-    # Flatten results
-    total_flat = [count for batch in results for count in batch[0]]
-    unique_flat = [count for batch in results for count in batch[1]]
-    flagged_flat = [kw_list for batch in results for kw_list in batch[2]]
+        _init_keyword_processor(keyword_list)
+        results = [_process_batch(chunk) for chunk in chunks]
+
+    # Write each batch into preallocated row-aligned outputs at its start offset
+    total_flat = np.empty(len(df), dtype=np.int64)
+    flagged_flat: List[List[str]] = [None] * len(df)
+    for start, total, flagged in results:
+        end = start + len(total)
+        total_flat[start:end] = total
+        flagged_flat[start:end] = flagged
+
+    # Matched terms as one Arrow list<string> column (offsets + contiguous string buffer) rather than boxed Python lists
+    flagged_arr = pa.array(flagged_flat, type=pa.list_(pa.string()))
+    # flagged is already de-duplicated per row, so its list lengths are the unique counts
+    unique_flat = pc.list_value_length(flagged_arr).to_numpy()
+
+    # Assign enrichment columns; counts are non-negative and small, so store them in the narrowest unsigned type
+    df["total count"] = pd.to_numeric(pd.Series(total_flat, index=df.index), downcast="unsigned")
+    df["total unique count"] = pd.to_numeric(pd.Series(unique_flat, index=df.index), downcast="unsigned")
+    df["flagged"] = pd.Series(pd.arrays.ArrowExtensionArray(flagged_arr), index=df.index)
+
+    # Build summary; row-level reductions run on the count arrays
+    n_rows = len(df)
+    rows_with_hits = int(np.count_nonzero(total_flat))
+    rows_without_hits = n_rows - rows_with_hits
 
-    # Assign enrichment columns
-    df["total count"] = pd.Series(total_flat, index=df.index)
-    df["total unique count"] = pd.Series(unique_flat, index=df.index)
-    df["flagged"] = pd.Series(flagged_flat, index=df.index)
-    df.drop(columns="combined_text", inplace=True)
-
-    # Build summary
     enrichment_summary = {
-        "total_rows_processed": len(df),
+        "total_rows_processed": n_rows,
         "text_columns_used": available_cols,
         "max_workers": max_workers,
         "chunk_size": chunk_size,
         "keyword_pool_size": len(set(treatments + diseases)),
         "treatment_pool_size": len(set(treatments)),
         "disease_pool_size": len(set(diseases)),
-        "total_keyword_hits": sum(total_flat),
+        "total_keyword_hits": int(total_flat.sum()),
         "avg_hits_per_row": round(np.mean(total_flat), 2),
         "avg_unique_per_row": round(np.mean(unique_flat), 2),
-        "rows_with_hits": sum(1 for c in total_flat if c > 0),
-        "rows_with_hits_pct": round(sum(1 for c in total_flat if c > 0) / len(df) * 100, 2),
-        "rows_without_hits": sum(1 for c in total_flat if c == 0),
-        "rows_without_hits_pct": round(sum(1 for c in total_flat if c == 0) / len(df) * 100, 2),
-        "rows_flagged": sum(1 for flagged in flagged_flat if flagged),
-        "top_flagged_terms": Counter([kw for row in flagged_flat for kw in row]).most_common(10)
+        "rows_with_hits": rows_with_hits,
+        "rows_with_hits_pct": round(rows_with_hits / n_rows * 100, 2),
+        "rows_without_hits": rows_without_hits,
+        "rows_without_hits_pct": round(rows_without_hits / n_rows * 100, 2),
+        "rows_flagged": int(np.count_nonzero(unique_flat)),
+        "top_flagged_terms": _top_terms(flagged_arr, 10)
     }
 
     if logger:
         logger.info(f"Keyword enrichment complete — {df.shape[0]:,} rows processed")
 
     return df, enrichment_summary
+
+
+# Worker initializer: build the keyword processor once per process
+def _init_keyword_processor(keyword_list: List[str]) -> None:
+    global _keyword_processor
+    # Case-insensitive matching lowercases keywords and text internally; matches come back in keyword form
+    _keyword_processor = KeywordProcessor(case_sensitive=False)
+    _keyword_processor.add_keywords_from_list(keyword_list)
+    _extract_keywords.cache_clear()
+
+# Renewal years repeat titles, terms and abstracts verbatim, so identical texts are scanned once per process
+@lru_cache(maxsize=200_000)
+def _extract_keywords(text: str) -> Tuple[str, ...]:
+    return tuple(_keyword_processor.extract_keywords(text))
+
+# Batch processing
+def _process_batch(batch: Tuple[int, List[List[str]]]) -> Tuple[int, List[int], List[List[str]]]:
+    start, columns = batch
+    n = len(columns[0])
+    total, flagged = [0] * n, [None] * n
+    for i, row_texts in enumerate(zip(*columns)):
+        # Matches never span columns, so scanning each one and chaining equals scanning the joined text
+        keywords = [kw for text in row_texts for kw in _extract_keywords(text)]
+        total[i] = len(keywords)
+        flagged[i] = list(dict.fromkeys(keywords))
+    return start, total, flagged
+
+
+# Helper: most frequent matched terms, counted over the flattened Arrow list column
+def _top_terms(flagged_arr: pa.ListArray, n: int) -> List[Tuple[str, int]]:
+    counts = pc.value_counts(pc.list_flatten(flagged_arr))
+    terms = counts.field("values").to_pylist()
+    freqs = counts.field("counts").to_numpy()
+    # Stable sort keeps first-seen order among ties, as Counter.most_common does
+    top = np.argsort(-freqs, kind="stable")[:n]
+    return [(terms[i], int(freqs[i])) for i in top]
\ No newline at end of file
@@ -4,6 +4,10 @@ from nltk.corpus import stopwords
 from unidecode import unidecode
 import logging
 
+# Patterns applied to every keyword variant
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_Y_RE = re.compile(r"y$")
+
 def generate_keyword_variants(keyword: str) -> List[str]:
     original = unidecode(keyword.strip().lower())
     variants = set([original])
@@ -18,9 +22,9 @@ def generate_keyword_variants(keyword: str) -> List[str]:
         hyphen_space = original.replace("-", " ")
         variants.update([hyphen_space, hyphen_space + 's'])
 
-    keyword_clean = re.sub(r"[^\w\s]", "", original)
+    keyword_clean = _PUNCT_RE.sub("", original)
     if keyword_clean.endswith('y') and not keyword_clean.endswith(('ay', 'ey', 'oy', 'uy')):
-        variants.add(re.sub(r'y$', 'ies', keyword_clean))
+        variants.add(_Y_RE.sub("ies", keyword_clean))
     elif keyword_clean.endswith(('s', 'x', 'z', 'ch', 'sh')):
         variants.add(keyword_clean + 'es')
     else:
@@ -35,10 +39,11 @@ def enrich_keywords(
     stopword_set = set(stopwords.words('english')) if remove_stopwords else set()
     enriched = set()
 
-    for kw in keywords:
-        kw_norm = unidecode(kw.strip().lower())
-        if remove_stopwords and kw_norm in stopword_set:
-            continue
+    # Normalize and de-duplicate first so each distinct keyword is expanded once
+    kw_set = {unidecode(kw.strip().lower()) for kw in keywords}
+    kw_set -= stopword_set
+
+    for kw_norm in kw_set:
         enriched.update(generate_keyword_variants(kw_norm))
 
     return sorted(enriched)
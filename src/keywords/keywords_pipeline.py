@@ -1,3 +1,4 @@
+import pandas as pd
 from common.config_loader import load_config
 from common.logger import configure_logger
 from common.path_utils import resolve_output_path, resolve_input_files
@@ -7,6 +8,9 @@ from .keywords_keywords_generator import prepare_keywords
 from .keywords_keywords_enrichment import enrich_with_keyword_metrics
 from .keywords_summary import assemble_keywords_metadata, build_keywords_summary
 
+# Defer copies of shared column blocks until a stage actually writes to them
+pd.set_option("mode.copy_on_write", True)
+
 def keywords(metrics: str, config_path: str, output_path: str, summary_path: str):  
     # 1. Load configuration and logger
     config = load_config(config_path)
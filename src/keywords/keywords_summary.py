@@ -20,8 +20,8 @@ def assemble_keywords_metadata(
     return {
         "keywords_summary": keywords_summary,
         "enrichment_summary": enrichment_summary,
-        "total_rows": int(keywords_df.shape[0]),
-        "total_columns": int(keywords_df.shape[1])
+        "total_rows": keywords_df.shape[0],
+        "total_columns": keywords_df.shape[1]
     }
 
 def build_keywords_summary(keywords_stats: Dict) -> Dict:
@@ -1,14 +1,19 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import logging
 from typing import Dict, Tuple, Optional 
 
+_ARROW_STRING = pd.ArrowDtype(pa.string())
+
 def normalize_columns(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
     """
     Strips whitespace and uppercases values in specified columns to normalize formatting.
+    Values are cast to Arrow strings so both steps run as Arrow compute kernels; nulls stay null.
     """
     for col in cols:
         if col in df.columns:
-            df[col] = df[col].astype(str).str.strip().str.upper()
+            df[col] = df[col].astype(_ARROW_STRING).str.strip().str.upper()
     return df
 
 def count_unique_pairs(
@@ -16,17 +21,22 @@ def count_unique_pairs(
     combo_cols: list[str],
     count_name: str,
     logger: Optional[logging.Logger] = None
-) -> Tuple[pd.DataFrame, dict]:
+) -> Tuple[pd.Series, dict]:
+    """
+    Finds distinct combo_cols pairs and reports duplicate metrics.
+    Returns the PROJECT_NUMBER of each distinct pair, for per-project counting.
+    """
     try:
-        duplicates_all = df.duplicated(subset=combo_cols, keep=False)
-        duplicates_extra = df.duplicated(subset=combo_cols, keep="first")
-        distinct_duplicate_rows = df[duplicates_all].drop_duplicates(subset=combo_cols)
+        # Pack the factorized pair into one exact int64 key; every duplicate metric and the first occurrences come from one np.unique
+        keys = _pair_keys(df, combo_cols)
+        _, first_idx, counts = np.unique(keys, return_index=True, return_counts=True)
+        repeated = counts > 1
 
         dedup_summary = {
             count_name: {
-                "unique_duplicate_rows": distinct_duplicate_rows.shape[0],
-                "total_duplicates": int(duplicates_all.sum()),
-                "extra_duplicates": int(duplicates_extra.sum()),
+                "unique_duplicate_rows": int(repeated.sum()),
+                "total_duplicates": int(counts[repeated].sum()),
+                "extra_duplicates": int(len(keys) - len(counts)),
             }
         }
 
@@ -38,18 +48,27 @@ def count_unique_pairs(
                 f"{row['extra_duplicates']:,} extra duplicates."
             )
 
-        unique = df.drop_duplicates(subset=combo_cols)
-        count_df = (
-            unique.groupby("PROJECT_NUMBER")
-            .size()
-            .reset_index(name=count_name)
-        )
-        return count_df, dedup_summary
+        return df["PROJECT_NUMBER"].iloc[first_idx], dedup_summary
 
     except Exception:
         if logger:
             logger.error(f"Failed to process {count_name}", exc_info=True)
-        return pd.DataFrame(columns=["PROJECT_NUMBER", count_name]), {}
+        return pd.Series(dtype=_ARROW_STRING), {}
+
+# Helper: collision-free int64 key per row from the factorized combo columns (missing values share one code)
+def _pair_keys(df: pd.DataFrame, combo_cols: list[str]) -> np.ndarray:
+    keys = np.zeros(len(df), dtype=np.int64)
+    for col in combo_cols:
+        codes, uniques = pd.factorize(df[col], use_na_sentinel=False)
+        keys = keys * len(uniques) + codes
+    return keys
+
+# Helper: distinct-pair counts aligned to the rows of the project table
+def _project_counts(codes: np.ndarray, projects: pd.Index, pair_projects: pd.Series) -> np.ndarray:
+    pair_codes = projects.get_indexer(pair_projects)
+    counts = np.bincount(pair_codes[pair_codes >= 0], minlength=len(projects))
+    # Rows without a PROJECT_NUMBER factorize to -1, which picks up the trailing zero
+    return np.append(counts, 0)[codes]
 
 def aggregate_project_outputs(
     linked_merged: Dict[str, pd.DataFrame],
@@ -60,10 +79,21 @@ def aggregate_project_outputs(
     Aggregates publication, patent, and clinical study counts by PROJECT_NUMBER
     into a unified project-level DataFrame.
     """
-    prj_df = linked_merged["PRJ_PRJABS"].copy()
+    prj_df = linked_merged.get("PRJ_PRJABS")
+    if prj_df is None:
+        if logger:
+            logger.error("Merged 'PRJ_PRJABS' DataFrame not available; skipping outcome aggregation.")
+        return pd.DataFrame(), {}
+
+    # rename returns a new frame; under copy-on-write it shares blocks with the merged input until written
     aggregate_df = prj_df.rename(columns={"PROJECT_NUMBER_x": "PROJECT_NUMBER"})
     aggregate_outcomes_summary_dict = {}
 
+    # Factorize project numbers once; each outcome count becomes a bincount over these codes
+    codes, uniques = pd.factorize(aggregate_df["PROJECT_NUMBER"])
+    projects = pd.Index(uniques)
+    count_columns = {}
+
     # Publications count via PROJECT_NUMBER + PMID combination
     publications = appended_dict.get("PUBLINK")
     if publications is not None:
@@ -72,15 +102,14 @@ def aggregate_project_outputs(
             publications = normalize_columns(publications, ["PMID", "PROJECT_NUMBER"])
 
             # Step 2: Count unique PROJECT_NUMBER + PMID pairs
-            pub_count, pub_summary = count_unique_pairs(publications, ["PROJECT_NUMBER", "PMID"], "publication count", logger)
+            pub_projects, pub_summary = count_unique_pairs(publications, ["PROJECT_NUMBER", "PMID"], "publication count", logger)
 
-            # Step 3: Merge into final project-level dataframe
-            aggregate_df = aggregate_df.merge(pub_count, on="PROJECT_NUMBER", how="left")
-            aggregate_df["publication count"] = aggregate_df["publication count"].fillna(0).astype(int)
+            # Step 3: Align counts to the project-level dataframe
+            count_columns["publication count"] = _project_counts(codes, projects, pub_projects)
             aggregate_outcomes_summary_dict.update(pub_summary)
             
             if logger:
-                logger.info(f"Merged publication counts: {aggregate_df.shape[0]:,} rows × {aggregate_df.shape[1]:,} columns")
+                logger.info(f"Computed publication counts for {len(projects):,} projects")
         except Exception:
             if logger:
                 logger.error("Failed to compute publication counts", exc_info=True)
@@ -93,15 +122,14 @@ def aggregate_project_outputs(
             patents = normalize_columns(patents, ["PROJECT_NUMBER", "PATENT_ID"])
 
             # Step 2: Count unique PROJECT_NUMBER + PATENT_ID pairs
-            patent_count, patent_summary = count_unique_pairs(patents, ["PROJECT_NUMBER", "PATENT_ID"], "patent count", logger)
+            patent_projects, patent_summary = count_unique_pairs(patents, ["PROJECT_NUMBER", "PATENT_ID"], "patent count", logger)
 
-            # Step 3: Merge into aggregate_df
-            aggregate_df = aggregate_df.merge(patent_count, on="PROJECT_NUMBER", how="left")
-            aggregate_df["patent count"] = aggregate_df["patent count"].fillna(0).astype(int)
+            # Step 3: Align counts to aggregate_df
+            count_columns["patent count"] = _project_counts(codes, projects, patent_projects)
             aggregate_outcomes_summary_dict.update(patent_summary)
 
             if logger:
-                logger.info(f"Merged patent counts: {aggregate_df.shape[0]:,} rows × {aggregate_df.shape[1]:,} columns")
+                logger.info(f"Computed patent counts for {len(projects):,} projects")
         except Exception:
             if logger:
                 logger.error("Failed to compute or merge patent counts", exc_info=True)
@@ -114,17 +142,22 @@ def aggregate_project_outputs(
             studies = normalize_columns(studies, ["PROJECT_NUMBER", "ClinicalTrials.gov ID"])
 
             # Step 2: Count unique PROJECT_NUMBER + ClinicalTrials.gov ID pairs
-            study_count, study_summary = count_unique_pairs(studies, ["PROJECT_NUMBER", "ClinicalTrials.gov ID"], "clinical study count", logger)
+            study_projects, study_summary = count_unique_pairs(studies, ["PROJECT_NUMBER", "ClinicalTrials.gov ID"], "clinical study count", logger)
 
-            # Step 3: Merge into aggregate_df
-            aggregate_df = aggregate_df.merge(study_count, on="PROJECT_NUMBER", how="left")
-            aggregate_df["clinical study count"] = aggregate_df["clinical study count"].fillna(0).astype(int)
+            # Step 3: Align counts to aggregate_df
+            count_columns["clinical study count"] = _project_counts(codes, projects, study_projects)
             aggregate_outcomes_summary_dict.update(study_summary)
             
             if logger:
-                logger.info(f"Merged clinical study counts: {aggregate_df.shape[0]:,} rows × {aggregate_df.shape[1]:,} columns")
+                logger.info(f"Computed clinical study counts for {len(projects):,} projects")
         except Exception:
             if logger:
                 logger.error("Failed to compute or merge clinical study counts", exc_info=True)
 
+    # Attach every computed count column in one step
+    if count_columns:
+        aggregate_df = aggregate_df.assign(**count_columns)
+        if logger:
+            logger.info(f"Merged outcome counts: {aggregate_df.shape[0]:,} rows × {aggregate_df.shape[1]:,} columns")
+
     return aggregate_df, aggregate_outcomes_summary_dict
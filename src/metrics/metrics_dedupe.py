@@ -1,13 +1,17 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import logging
-from typing import Tuple, Optional
+from typing import Tuple, Optional, List
 
 def remove_true_duplicates_from_df(
     df: pd.DataFrame,
-    logger: Optional[logging.Logger] = None
+    logger: Optional[logging.Logger] = None,
+    subset: Optional[List[str]] = None
 ) -> Tuple[pd.DataFrame, dict]:
     """
     Detects and removes fully duplicated rows from a DataFrame.
+    When subset is given, rows are compared on those key columns only instead of every column.
 
     Returns:
         Tuple:
@@ -25,28 +29,37 @@ def remove_true_duplicates_from_df(
     if logger:
         logger.info(f"Checking for true duplicates in 'Aggregate_output'...")
 
-    dedupe_df = df.copy()
+    # Compare on the configured key columns when they are all present, otherwise on the full row
+    if subset:
+        missing = [col for col in subset if col not in df.columns]
+        if missing:
+            if logger:
+                logger.warning(f"Dedupe subset columns missing {missing}; comparing full rows.")
+            subset = None
 
-    # Convert list-like columns to hashable tuples
-    for col in dedupe_df.columns:
-        if dedupe_df[col].apply(lambda x: isinstance(x, list)).any():
-            dedupe_df[col] = dedupe_df[col].map(lambda x: tuple(x) if isinstance(x, list) else x)
+    # Hash every row once to find candidate groups, then confirm only those rows with an exact
+    # comparison, so a hash collision can never drop a distinct row
+    frame = df[subset] if subset else df
+    candidates = _hash_rows(frame).duplicated(keep=False).to_numpy()
 
-    # Compute all duplicate metrics
-    duplicates_all = dedupe_df.duplicated(keep=False)
-    duplicates_extra = dedupe_df.duplicated(keep="first") 
-    distinct_duplicate_rows = dedupe_df[duplicates_all].drop_duplicates()
+    duplicates_all = np.zeros(len(df), dtype=bool)
+    duplicates_extra = np.zeros(len(df), dtype=bool)
+    if candidates.any():
+        exact = _hashable_rows(frame[candidates])
+        duplicates_all[candidates] = exact.duplicated(keep=False).to_numpy()
+        duplicates_extra[candidates] = exact.duplicated(keep="first").to_numpy()
 
-    total_duplicates = duplicates_all.sum()
-    extra_duplicates = duplicates_extra.sum()
-    unique_duplicate_rows = distinct_duplicate_rows.shape[0]
+    total_duplicates = int(duplicates_all.sum())
+    extra_duplicates = int(duplicates_extra.sum())
+    # Each group of k identical rows adds k to the total and k - 1 to the extras
+    unique_duplicate_rows = total_duplicates - extra_duplicates
 
     # Summary metrics
     dedupe_summary_dict = {
         "Aggregate_output": {
-            "unique_duplicate_rows": int(unique_duplicate_rows),
-            "total_duplicates": int(total_duplicates),
-            "extra_duplicates": int(extra_duplicates)
+            "unique_duplicate_rows": unique_duplicate_rows,
+            "total_duplicates": total_duplicates,
+            "extra_duplicates": extra_duplicates
         }
     }
 
@@ -57,11 +70,14 @@ def remove_true_duplicates_from_df(
         )
 
     # Drop all duplicates
+    dedupe_df = df
     if total_duplicates > 0:
         if logger:
-            logger.info(f"Found {total_duplicates:,} duplicate rows in 'Aggregate_output'. Showing sample...")
-            logger.info(dedupe_df[duplicates_all].head())
-        dedupe_df = dedupe_df.drop_duplicates()
+            logger.info(f"Found {total_duplicates:,} duplicate rows in 'Aggregate_output'.")
+            # Slicing and rendering the sample is only worth it when debug output is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Duplicate sample:\n%s", df[duplicates_all].head())
+        dedupe_df = df[~duplicates_extra]
         if logger:
             logger.info(f"Duplicates removed — new shape: {dedupe_df.shape[0]:,} rows × {dedupe_df.shape[1]:,} columns")
     else:
@@ -69,3 +85,27 @@ def remove_true_duplicates_from_df(
             logger.info(f"No duplicate rows found in 'Aggregate_output'.")
 
     return dedupe_df, dedupe_summary_dict
+
+def _hash_rows(df: pd.DataFrame) -> pd.Series:
+    """
+    Returns one uint64 hash per row over all columns; equal rows always hash equal,
+    but distinct rows may collide, so matches are only candidates.
+    Unhashable cells (e.g. lists) cannot be categorized, so they fall back to hashing their string form.
+    """
+    try:
+        return pd.util.hash_pandas_object(df, index=False)
+    except TypeError:
+        return pd.util.hash_pandas_object(df, index=False, categorize=False)
+
+
+def _hashable_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns the rows with list-valued cells turned into tuples so DataFrame.duplicated can compare them exactly.
+    Only called on hash-collision candidates, which are usually few.
+    """
+    converted = {}
+    for col, dtype in df.dtypes.items():
+        if dtype == object or (isinstance(dtype, pd.ArrowDtype) and pa.types.is_list(dtype.pyarrow_dtype)):
+            values = [tuple(v) if isinstance(v, (list, np.ndarray)) else v for v in df[col]]
+            converted[col] = pd.Series(values, index=df.index, dtype=object)
+    return df.assign(**converted) if converted else df
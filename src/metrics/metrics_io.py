@@ -1,40 +1,55 @@
 import json
 import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, Union 
 import logging 
 
-def load_pickle_dataframes(
-    pickle_map: Dict[str, Union[str, Path]],
-    logger: Optional[logging.Logger] = None
+def load_feather_dataframes(
+    frame_map: Dict[str, Union[str, Path]],
+    logger: Optional[logging.Logger] = None,
+    max_workers: int = 4
 ) -> Dict[str, pd.DataFrame]:
     """
-    Loads DataFrames from a dict of name → pickle file path.
+    Loads DataFrames from a dict of name → Feather file path.
+    Files are memory-mapped and wrapped as ArrowDtype columns without copying; reads run on a thread pool.
 
     Parameters:
-        pickle_map: dict mapping keys (e.g. folder names) to pickle file paths.
+        frame_map: dict mapping keys (e.g. folder names) to Feather file paths.
         logger: optional logger for diagnostics.
+        max_workers: threads used to open files concurrently.
 
     Returns:
         Dict of key → loaded DataFrame
     """
     if logger:
-        logger.info("Loading preprocessed DataFrames from pickle files...")
-
-    loaded_dict = {}
+        logger.info("Loading preprocessed DataFrames from Feather files...")
 
-    for name, path in pickle_map.items():
-        df = pd.read_pickle(path)
-        loaded_dict[name] = df
+    names = list(frame_map.keys())
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frames = list(executor.map(_read_feather, frame_map.values()))
 
-        if logger:
-            logger.info(f"  └─ {name}: {df.shape[0]:,} rows × {df.shape[1]:,} columns")
+    loaded_dict = dict(zip(names, frames))
 
     if logger:
-        logger.info(f"Loaded {len(loaded_dict)} pickle file(s).")
+        for name, df in loaded_dict.items():
+            logger.info(f"  └─ {name}: {df.shape[0]:,} rows × {df.shape[1]:,} columns")
+        logger.info(f"Loaded {len(loaded_dict)} Feather file(s).")
 
     return loaded_dict
 
+# Helper: zero-copy Feather read into Arrow-backed columns
+def _read_feather(path: Union[str, Path]) -> pd.DataFrame:
+    table = feather.read_table(path, memory_map=True)
+    return table.to_pandas(types_mapper=_arrow_dtype_unless_dictionary)
+
+# Helper: dictionary columns (categorized in preprocess) load as pandas Categorical;
+# as ArrowDtype(dictionary) their nulls hash like real values and break dedupe
+def _arrow_dtype_unless_dictionary(arrow_type: pa.DataType) -> Optional[pd.ArrowDtype]:
+    return None if pa.types.is_dictionary(arrow_type) else pd.ArrowDtype(arrow_type)
+
 def export_metrics_csv(
     metrics_df: pd.DataFrame,
     output_dir: Path,
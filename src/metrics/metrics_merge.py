@@ -1,7 +1,10 @@
 import pandas as pd
+import pyarrow as pa
 import logging
 from typing import Dict, Tuple, Optional 
 
+_ARROW_STRING = pd.ArrowDtype(pa.string())
+
 def merge_linked_dataframes(
     dataframes: Dict[str, pd.DataFrame],
     logger: Optional[logging.Logger] = None,
@@ -37,16 +40,22 @@ def merge_linked_dataframes(
     # Merge PRJ + PRJABS
     if prj is not None and prjabs is not None:
         try:
-            # Ensure APPLICATION_ID is string and stripped for consistency
-            prj["APPLICATION_ID"] = prj["APPLICATION_ID"].astype(str).str.strip().str.upper()
-            prjabs["APPLICATION_ID"] = prjabs["APPLICATION_ID"].astype(str).str.strip().str.upper()
+            # Ensure APPLICATION_ID is string and stripped for consistency (Arrow string kernels; nulls stay null)
+            prj["APPLICATION_ID"] = prj["APPLICATION_ID"].astype(_ARROW_STRING).str.strip().str.upper()
+            prjabs["APPLICATION_ID"] = prjabs["APPLICATION_ID"].astype(_ARROW_STRING).str.strip().str.upper()
 
             # Record pre-merge dimensions
             prj_shape = prj.shape
             prjabs_shape = prjabs.shape
 
-            # Perform merge
-            joined = pd.merge(prj, prjabs, on="APPLICATION_ID", how="left")
+            # Perform merge on shared int codes of the normalized IDs rather than hashing the strings in the join
+            codes, _ = pd.factorize(pd.concat([prj["APPLICATION_ID"], prjabs["APPLICATION_ID"]], ignore_index=True))
+            joined = pd.merge(
+                prj.assign(_aid=codes[:prj_shape[0]]),
+                prjabs.drop(columns="APPLICATION_ID").assign(_aid=codes[prj_shape[0]:]),
+                on="_aid",
+                how="left"
+            ).drop(columns="_aid")
 
             # Record post-merge dimensions
             joined_shape = joined.shape
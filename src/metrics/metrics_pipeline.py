@@ -1,3 +1,4 @@
+import pandas as pd
 from common.config_loader import load_config
 from common.logger import configure_logger
 from common.path_utils import resolve_input_files, resolve_output_path
@@ -6,25 +7,28 @@ from .metrics_merge import merge_linked_dataframes
 from .metrics_aggregate import aggregate_project_outputs
 from .metrics_dedupe import remove_true_duplicates_from_df
 from .metrics_summary import assemble_metrics_metadata, build_metrics_summary
-from .metrics_io import load_pickle_dataframes, export_metrics_csv
+from .metrics_io import load_feather_dataframes, export_metrics_csv
 from typing import Optional, List 
 
+# Defer copies of shared column blocks until a stage actually writes to them
+pd.set_option("mode.copy_on_write", True)
 
-def metrics(pickles: Optional[List[str]], config_path: str, output_path: str, summary_path: str):
+
+def metrics(frames: Optional[List[str]], config_path: str, output_path: str, summary_path: str):
     # 1. Load configuration and set up logger
     config = load_config(config_path)
     logger = configure_logger(config=config)
 
-     # 2. Resolve input pickle files
-    pickle_map = resolve_input_files("metrics", pickles, config, logger)
+     # 2. Resolve input Feather files
+    frame_map = resolve_input_files("metrics", frames, config, logger)
 
-     # 3. Load all DataFrames from pickle files into a dict
-    appended_dict = load_pickle_dataframes (pickle_map, logger)
+     # 3. Load all DataFrames from Feather files into a dict
+    appended_dict = load_feather_dataframes (frame_map, logger, max_workers=config.get("workers", 4))
     
     # 4. Run metrics pipeline 
     linked_dict, linked_summary = merge_linked_dataframes(appended_dict, logger) # Merge linked records
     aggregate_df, aggregate_summary = aggregate_project_outputs(linked_dict, appended_dict, logger) # Aggregate project outcomes
-    metrics_df, dedupe_summary = remove_true_duplicates_from_df(aggregate_df, logger) # Deduplicate records
+    metrics_df, dedupe_summary = remove_true_duplicates_from_df(aggregate_df, logger, subset=config.get("dedupe_subset")) # Deduplicate records
 
     # 5. Resolve output directory
     output_dir = resolve_output_path(stage ="metrics", output_path = output_path, config=config, logger=logger)
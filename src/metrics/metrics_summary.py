@@ -14,8 +14,8 @@ def assemble_metrics_metadata(
         "linked_summary": linked_summary,
         "aggregate_outcomes_summary": aggregate_outcomes_summary,
         "dedupe_summary": dedupe_summary,
-        "total_rows": int(metrics_df.shape[0]),
-        "total_columns": int(metrics_df.shape[1])
+        "total_rows": metrics_df.shape[0],
+        "total_columns": metrics_df.shape[1]
     }
 
 def build_metrics_summary(
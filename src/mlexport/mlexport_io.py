@@ -1,11 +1,12 @@
 import pandas as pd
 from pathlib import Path
-from typing import Optional, Union, Dict
+from typing import Optional, Union, Dict, List
 import logging
 
 def load_keywords_dataframe(
     keywords_path: str,
-    logger: Optional[logging.Logger] = None
+    logger: Optional[logging.Logger] = None,
+    usecols: Optional[List[str]] = None
 ) -> pd.DataFrame:
     """
     Load the keywords-enriched DataFrame from a CSV file.
@@ -13,6 +14,7 @@ def load_keywords_dataframe(
     Args:
         keywords_path: Path to 'keywords.csv'
         logger: Optional logger for diagnostics
+        usecols: Optional columns to parse; others are skipped by the tokenizer. Missing names are not an error
 
     Returns:
         Loaded DataFrame
@@ -26,7 +28,11 @@ def load_keywords_dataframe(
             logger.error(f"Keywords file not found: {path}")
         raise FileNotFoundError(f"Keywords file does not exist: {path}")
 
-    keywords_df = pd.read_csv(path, low_memory=False)
+    # Arrow-backed columns keep the long text fields out of per-cell Python objects
+    # A callable selector skips absent names instead of raising, so filter_df can report them
+    wanted = set(usecols) if usecols else None
+    column_filter = (lambda col: col in wanted) if wanted else None
+    keywords_df = pd.read_csv(path, low_memory=False, dtype_backend="pyarrow", usecols=column_filter)
 
     if logger:
         logger.info(f"Loaded keywords DataFrame: {keywords_df.shape[0]:,} rows × {keywords_df.shape[1]:,} columns")
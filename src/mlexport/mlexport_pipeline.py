@@ -1,3 +1,4 @@
+import pandas as pd
 from common.config_loader import load_config
 from common.logger import configure_logger
 from common.path_utils import resolve_input_files, resolve_output_path
@@ -6,6 +7,9 @@ from .mlexport_io import load_keywords_dataframe, export_mlexport_csv
 from .mlexport_transform import filter_df
 from .mlexport_summary import assemble_mlexport_metadata, build_mlexport_summary
 
+# Defer copies of shared column blocks until a stage actually writes to them
+pd.set_option("mode.copy_on_write", True)
+
 
 def mlexport(keywords: str, config_path: str, output_path: str, summary_path: str):
     # 1️. Load config and initialize logger
@@ -14,7 +18,8 @@ def mlexport(keywords: str, config_path: str, output_path: str, summary_path: st
 
     # 2️. Resolve input path and ingest keywords DataFrame
     keywords_path = resolve_input_files("mlexport", keywords, config, logger)
-    keywords_df = load_keywords_dataframe(keywords_path, logger)
+    ml_usecols = [*config.get("ml_columns", []), "total unique count"]
+    keywords_df = load_keywords_dataframe(keywords_path, logger, usecols=ml_usecols)
 
     # 3️. Run filtering logic
     MLdf, MLdf_dropped, mlexport_summary = filter_df(
@@ -1,6 +1,16 @@
 import pandas as pd
 from typing import Optional, Dict, Any
 
+# Keys copied from the mlexport filter stats into the summary after ml_columns_used, in output order
+_FILTER_KEYS = (
+    "cutoff_value",
+    "total_input_rows",
+    "total_retained_rows",
+    "total_dropped_rows",
+    "percent_retained",
+    "percent_dropped"
+)
+
 def assemble_mlexport_metadata(
     mlexport_df: pd.DataFrame,
     dropped_df: Optional[pd.DataFrame],
@@ -24,9 +34,9 @@ def assemble_mlexport_metadata(
 
     return {
         "mlexport_summary": mlexport_summary or {},
-        "total_rows": int(mlexport_df.shape[0]),
-        "total_columns": int(mlexport_df.shape[1]),
-        "exported_dropped_rows": int(dropped_df.shape[0]) if export_dropped and dropped_df is not None else 0
+        "total_rows": mlexport_df.shape[0],
+        "total_columns": mlexport_df.shape[1],
+        "exported_dropped_rows": dropped_df.shape[0] if export_dropped and dropped_df is not None else 0
     }
 
 def build_mlexport_summary(
@@ -48,12 +58,7 @@ def build_mlexport_summary(
         summary["ml_training"] = {
             "filter_summary": {
                 "ml_columns_used": fs.get("ml_columns_used", []),
-                "cutoff_value": fs.get("cutoff_value"),
-                "total_input_rows": fs.get("total_input_rows"),
-                "total_retained_rows": fs.get("total_retained_rows"),
-                "total_dropped_rows": fs.get("total_dropped_rows"),
-                "percent_retained": fs.get("percent_retained"),
-                "percent_dropped": fs.get("percent_dropped")
+                **{k: fs.get(k) for k in _FILTER_KEYS}
             },
             "output_dimensions": {
                 "total_rows": mlexport_stats.get("total_rows"),
@@ -48,28 +48,34 @@ def filter_df(
     try:
         cutoff_value = int(config.get("cutoff_value", 0))
 
-        df_retained = df[df[required_col] >= cutoff_value]
-        df_dropped = df[df[required_col] < cutoff_value]
+        # Single mask drives both the row split and the column projection
+        retained_mask = (df[required_col] >= cutoff_value).to_numpy()
 
-        MLdf = df_retained[columns_to_extract]
-        MLdf_dropped = df_dropped[columns_to_extract]
+        MLdf = df.loc[retained_mask, columns_to_extract]
+        MLdf_dropped = df.loc[~retained_mask, columns_to_extract]
+
+        # Boolean .loc keeps input order, so the first/last labels of each split bound its index range
+        # (the CSV-loaded frame has a monotonic RangeIndex)
+        n_rows = df.shape[0]
+        n_retained = MLdf.shape[0]
+        n_dropped = MLdf_dropped.shape[0]
 
     # Create a summary dictionary with metadata about the filtering process
         mlexport_summary = {
             "ml_columns_used": columns_to_extract,
             "cutoff_value": cutoff_value,
-            "total_input_rows": int(df.shape[0]),
-            "total_retained_rows": int(df_retained.shape[0]),
-            "total_dropped_rows": int(df_dropped.shape[0]),
-            "percent_retained": round((df_retained.shape[0] / df.shape[0]) * 100, 2) if df.shape[0] > 0 else None,
-            "percent_dropped": round((df_dropped.shape[0] / df.shape[0]) * 100, 2) if df.shape[0] > 0 else None,
-            "retained_index_range": [int(df_retained.index.min()), int(df_retained.index.max())] if not df_retained.empty else None,
-            "dropped_index_range": [int(df_dropped.index.min()), int(df_dropped.index.max())] if not df_dropped.empty else None
+            "total_input_rows": int(n_rows),
+            "total_retained_rows": int(n_retained),
+            "total_dropped_rows": int(n_dropped),
+            "percent_retained": round((n_retained / n_rows) * 100, 2) if n_rows > 0 else None,
+            "percent_dropped": round((n_dropped / n_rows) * 100, 2) if n_rows > 0 else None,
+            "retained_index_range": [int(MLdf.index[0]), int(MLdf.index[-1])] if n_retained else None,
+            "dropped_index_range": [int(MLdf_dropped.index[0]), int(MLdf_dropped.index[-1])] if n_dropped else None
         }
 
         if logger:
-            logger.info(f"Retained {MLdf.shape[0]} training rows, dropped {MLdf_dropped.shape[0]}")
-            logger.info(f"Columns used for ML: {columns_to_extract}")
+            logger.info("Retained %d training rows, dropped %d", n_retained, n_dropped)
+            logger.info("Columns used for ML: %s", columns_to_extract)
 
         return MLdf, MLdf_dropped, mlexport_summary
 
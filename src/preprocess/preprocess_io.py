@@ -1,24 +1,48 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from typing import Dict, List, Optional, Tuple, Any, Union
+import csv
+import hashlib
 import json
 import logging
+import os
+import re
+
+# Leading byte-order mark, seen as U+FEFF or (decoded as latin1) as its three UTF-8 bytes
+_BOM_RE = re.compile(r"^(?:\ufeff|ï»¿)")
 
 # Entry point for pipeline ingestion
 def ingest_dataframes(
     config: Dict,
     logger: Optional[logging.Logger] = None
 ) -> Tuple[Dict[str, Dict[str, pd.DataFrame]], Dict[str, Dict]]:
-    data_root = Path(__file__).resolve().parents[2] / config["folder"]
+    project_root = Path(__file__).resolve().parents[2]
+    data_root = project_root / config["folder"]
+    cache_dir = project_root / config["csv_cache_dir"] if config.get("csv_cache_dir") else None
+    column_types = {
+        col: pa.type_for_alias(type_name)
+        for col, type_name in (config.get("csv_column_types") or {}).items()
+    }
+    folder_column_types = {
+        folder: {col: pa.type_for_alias(type_name) for col, type_name in types.items()}
+        for folder, types in (config.get("subfolder_column_types") or {}).items()
+    }
 
     raw_dict = load_csv_files(
         logger=logger,
         main_folder=str(data_root),
         subfolders=config["subfolders"],
         use_parallel=config.get("parallel", False),
-        max_workers=config.get("workers", 4)
+        max_workers=config.get("workers", 4),
+        cache_dir=cache_dir,
+        column_types=column_types,
+        folder_column_types=folder_column_types,
+        block_size=config.get("csv_block_size"),
+        csv_index=config.get("_csv_index")
     )
 
     load_summary = summarize_csv_load(raw_dict)
@@ -30,30 +54,48 @@ def load_csv_files(
     main_folder: str,
     subfolders: List[str],
     use_parallel: bool = False,
-    max_workers: int = 4
+    max_workers: int = 4,
+    cache_dir: Optional[Path] = None,
+    column_types: Optional[Dict[str, pa.DataType]] = None,
+    folder_column_types: Optional[Dict[str, Dict[str, pa.DataType]]] = None,
+    block_size: Optional[int] = None,
+    csv_index: Optional[Dict[str, List[Path]]] = None
 ) -> Dict[str, Dict[str, pd.DataFrame]]:
     dataframes = {}
 
+    if cache_dir:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
     for folder_name in subfolders:
         folder_path = Path(main_folder) / folder_name
         if not folder_path.exists():
             if logger:
-                logger.warning(f"Missing folder: {folder_path.resolve()}")
+                logger.warning("Missing folder: %s", folder_path.resolve())
             continue
 
-        csv_files = list(folder_path.glob("*.csv"))
+        # Reuse the listing taken by validate_data_sources when available
+        csv_files = csv_index[folder_name] if csv_index and folder_name in csv_index else list_csv_files(folder_path)
         if not csv_files:
             if logger:
-                logger.warning(f"Folder exists but contains no CSVs: {folder_path.resolve()}")
+                logger.warning("Folder exists but contains no CSVs: %s", folder_path.resolve())
             continue
 
         if logger:
-            logger.info(f"Processing {folder_name} with {len(csv_files)} CSV(s)...")
+            logger.info("Processing %s with %d CSV(s)...", folder_name, len(csv_files))
         dataframes[folder_name] = {}
+        # Folder-specific types override the shared mapping for this folder's files
+        types = {**(column_types or {}), **(folder_column_types or {}).get(folder_name, {})} or None
 
         if use_parallel:
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                task = partial(_read_and_store, folder_name=folder_name, logger=logger)
+                task = partial(
+                    _read_and_store,
+                    folder_name=folder_name,
+                    logger=logger,
+                    cache_dir=cache_dir,
+                    column_types=types,
+                    block_size=block_size
+                )
                 for result in executor.map(task, csv_files):
                     if result:
                         key, df = result
@@ -61,50 +103,174 @@ def load_csv_files(
         else:
             for file_path in csv_files:
                 key = file_path.stem
-                df = read_csv_file(file_path, logger)
+                df = read_csv_file(file_path, logger, cache_dir, types, block_size)
                 if df.empty:
                     continue
                 dataframes[folder_name][key] = df
-                if logger:
+                # Skip the row/memory formatting entirely when INFO is filtered out
+                if logger and logger.isEnabledFor(logging.INFO):
                     logger.info(
-                        f"Loaded {key} from {folder_name} ({len(df):,} rows, "
-                        f"{df.memory_usage().sum()/1024/1024:.2f} MB)"
+                        "Loaded %s from %s (%s rows, %.2f MB)",
+                        key, folder_name, f"{len(df):,}", _frame_memory_mb(df)
                     )
 
     return dataframes
 
+# CSV listing from one directory scan; dirent types avoid a stat per regular file, symlinked CSVs are followed
+def list_csv_files(folder_path: Path) -> List[Path]:
+    with os.scandir(folder_path) as entries:
+        return [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(".csv") and entry.is_file()
+        ]
+
 # Individual file reader
-def read_csv_file(file_path: Path, logger: Optional[logging.Logger] = None) -> pd.DataFrame:
+def read_csv_file(
+    file_path: Path,
+    logger: Optional[logging.Logger] = None,
+    cache_dir: Optional[Path] = None,
+    column_types: Optional[Dict[str, pa.DataType]] = None,
+    block_size: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Reads one raw CSV into an Arrow-backed DataFrame.
+    When cache_dir is given, the parsed frame is stored as Feather keyed on the CSV's
+    mtime and size plus the parse options, and later runs load that instead of re-parsing
+    unchanged files.
+    column_types pins Arrow types for the named columns so the reader skips inferring them.
+    block_size sets the bytes per Arrow parse block (None keeps Arrow's 1 MiB default).
+    """
+    cache_path = _csv_cache_path(file_path, cache_dir, column_types, block_size) if cache_dir else None
+    if cache_path and cache_path.exists():
+        try:
+            return pd.read_feather(cache_path, dtype_backend="pyarrow")
+        except Exception as e:
+            if logger:
+                logger.warning("Ignoring unreadable cache for %s: %s", file_path.name, e)
+
     try:
-        with file_path.open("rb") as f:
-            df = pd.read_csv(
-                f,
-                encoding="latin1",
-                low_memory=False,
-                on_bad_lines="warn",
-                dtype_backend="pyarrow"
-            )
-        df.columns = [col.replace('\ufeff', '').replace('ï»¿', '').strip('"') for col in df.columns]
-        return df
+        try:
+            df = _read_csv_arrow(file_path, logger, column_types, block_size)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            # Arrow infers types from the first block; let pandas handle empty files, late type changes
+            # and short rows, which pandas keeps and pads with NA
+            if logger:
+                logger.debug("Arrow CSV reader failed for %s (%s); using pandas", file_path.name, e)
+            with file_path.open("rb") as f:
+                df = pd.read_csv(
+                    f,
+                    encoding="latin1",
+                    low_memory=False,
+                    on_bad_lines="warn",
+                    dtype_backend="pyarrow"
+                )
+            df.columns = df.columns.str.replace(_BOM_RE, "", regex=True).str.strip('"')
     except pd.errors.EmptyDataError:
         if logger:
-            logger.error(f"Empty file: {file_path.name}")
+            logger.error("Empty file: %s", file_path.name)
         return pd.DataFrame()
     except Exception as e:
         if logger:
-            logger.error(f"Failed to load {file_path.name}: {str(e)}", exc_info=True)
+            logger.error("Failed to load %s: %s", file_path.name, e, exc_info=True)
         return pd.DataFrame()
 
+    if cache_path and not df.empty:
+        _write_csv_cache(df, cache_path, logger)
+    return df
+
+# Multithreaded Arrow CSV parse straight into ArrowDtype columns
+def _read_csv_arrow(
+    file_path: Path,
+    logger: Optional[logging.Logger] = None,
+    column_types: Optional[Dict[str, pa.DataType]] = None,
+    block_size: Optional[int] = None
+) -> pd.DataFrame:
+    skipped_rows = []
+
+    # pandas (on_bad_lines="warn") drops rows with extra fields but pads short ones;
+    # Arrow can only skip, so a short row raises and the caller re-reads the file with pandas
+    def _skip_row(row) -> str:
+        if row.actual_columns < row.expected_columns:
+            return "error"
+        skipped_rows.append(row.number)
+        return "skip"
+
+    # Clean the header before parsing so column_types pins match BOM-prefixed first columns too
+    column_names = _read_csv_header(file_path)
+    table = pacsv.read_csv(
+        file_path,
+        # Larger blocks mean fewer, bigger reads per file and less per-block overhead
+        read_options=pacsv.ReadOptions(
+            encoding="latin1",
+            use_threads=True,
+            block_size=block_size,
+            column_names=column_names,
+            skip_rows=1 if column_names else 0
+        ),
+        # Abstracts contain quoted line breaks; empty cells become nulls as in pandas
+        parse_options=pacsv.ParseOptions(newlines_in_values=True, invalid_row_handler=_skip_row),
+        # Columns absent from this file are ignored by column_types
+        convert_options=pacsv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+    )
+    if skipped_rows and logger:
+        logger.warning("Skipped %d malformed rows in %s", len(skipped_rows), file_path.name)
+
+    return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+
+# Helper: first CSV record as cleaned column names, or None for an empty file
+def _read_csv_header(file_path: Path) -> Optional[List[str]]:
+    with file_path.open("r", encoding="latin1", newline="") as f:
+        header = next(csv.reader(f), None)
+    if not header:
+        return None
+    return [_BOM_RE.sub("", name).strip('"') for name in header]
+
+# Cache file for a raw CSV; any change to the source's mtime or size, or to the
+# type pins and block size that shape the parsed types, yields a new key
+def _csv_cache_path(
+    file_path: Path,
+    cache_dir: Path,
+    column_types: Optional[Dict[str, pa.DataType]] = None,
+    block_size: Optional[int] = None
+) -> Path:
+    stat = file_path.stat()
+    options = repr((sorted((col, str(dtype)) for col, dtype in (column_types or {}).items()), block_size))
+    digest = hashlib.sha1(options.encode("utf-8")).hexdigest()[:8]
+    return cache_dir / (
+        f"{file_path.parent.name}__{file_path.stem}-{stat.st_mtime_ns}-{stat.st_size}-{digest}.feather"
+    )
+
+def _write_csv_cache(df: pd.DataFrame, cache_path: Path, logger: Optional[logging.Logger] = None) -> None:
+    prefix = cache_path.name.rsplit("-", 3)[0]
+    try:
+        # Remove entries left behind by earlier versions of the same source file; the exact
+        # prefix comparison keeps e.g. X and X-new apart and needs no glob escaping
+        for stale in cache_path.parent.iterdir():
+            if stale.suffix == ".feather" and stale.name.rsplit("-", 3)[0] == prefix:
+                stale.unlink()
+        # Feather (Arrow IPC) reloads without a decode step beyond zstd decompression
+        df.to_feather(cache_path, compression="zstd")
+    except Exception as e:
+        if logger:
+            logger.warning("Failed to cache %s: %s", cache_path.name, e)
+
 # Parallel wrapper
-def _read_and_store(file_path: Path, folder_name: str, logger: Optional[logging.Logger] = None) -> Optional[Tuple[str, pd.DataFrame]]:
+def _read_and_store(
+    file_path: Path,
+    folder_name: str,
+    logger: Optional[logging.Logger] = None,
+    cache_dir: Optional[Path] = None,
+    column_types: Optional[Dict[str, pa.DataType]] = None,
+    block_size: Optional[int] = None
+) -> Optional[Tuple[str, pd.DataFrame]]:
     key = file_path.stem
-    df = read_csv_file(file_path, logger)
+    df = read_csv_file(file_path, logger, cache_dir, column_types, block_size)
     if df.empty:
         if logger:
-            logger.warning(f"Empty DataFrame: {file_path.name}")
+            logger.warning("Empty DataFrame: %s", file_path.name)
         return None
     if logger:
-        logger.info(f"[Parallel] Loaded {key} from {folder_name}")
+        logger.info("[Parallel] Loaded %s from %s", key, folder_name)
     return key, df
 
 # Collect summary of loaded DataFrames
@@ -115,26 +281,73 @@ def summarize_csv_load(dataframes: Dict[str, Dict[str, pd.DataFrame]]) -> Dict[s
             "folder": folder,
             "file_count": len(files),
             "total_rows": sum(df.shape[0] for df in files.values()),
-            "total_memory": sum(df.memory_usage().sum() for df in files.values()) / (1024 * 1024)
+            "total_memory": sum(_frame_memory_mb(df) for df in files.values())
         }
     return summary
 
-# Save each DataFrame to pickle
-def save_pickle_files(
+# Shallow column footprint in MB; Arrow-backed columns report buffer sizes, so no per-cell sizing or index entry is needed
+def _frame_memory_mb(df: pd.DataFrame) -> float:
+    return df.memory_usage(index=False, deep=False).sum() / (1024 * 1024)
+
+# Save each DataFrame to Feather (Arrow IPC); uncompressed files can be memory-mapped by the metrics stage
+def save_feather_files(
     appended_dict: Dict[str, pd.DataFrame],
     output_dir: Path,
-    logger: Optional[logging.Logger] = None
+    logger: Optional[logging.Logger] = None,
+    compression: str = "uncompressed",
+    max_workers: int = 4
 ) -> None:
+    """
+    Writes each appended DataFrame to {name}.feather.
+    Uncompressed files can be memory-mapped by the metrics stage without a decode step;
+    "zstd" or "lz4" trade that for smaller files.
+    Arrow releases the GIL while writing, so folders are written concurrently.
+    """
     if logger:
-        logger.info(f"Saving {len(appended_dict)} pickle file(s) to: {output_dir}")
+        logger.info("Saving %d Feather file(s) to: %s", len(appended_dict), output_dir)
 
     print(" Exporting the following keys:", list(appended_dict.keys()))
-    for name, df in appended_dict.items():
-        path = output_dir / f"{name}.pkl"
-        try:
-            df.to_pickle(path)
-            if logger:
-                logger.info(f"Saved {name}.pkl to {path}")
-        except Exception as e:
-            if logger:
-                logger.error(f"Failed to save {name}.pkl: {str(e)}", exc_info=True)
\ No newline at end of file
+    if not appended_dict:
+        return
+
+    task = partial(_save_feather, output_dir=output_dir, compression=compression, logger=logger)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(appended_dict))) as executor:
+        list(executor.map(task, appended_dict.keys(), appended_dict.values()))
+
+# Helper: write one appended DataFrame
+def _save_feather(
+    name: str,
+    df: pd.DataFrame,
+    output_dir: Path,
+    compression: str,
+    logger: Optional[logging.Logger] = None
+) -> None:
+    path = output_dir / f"{name}.feather"
+    try:
+        _stringify_mixed_columns(df).to_feather(path, compression=compression)
+        if logger:
+            logger.info("Saved %s.feather to %s", name, path)
+    except Exception as e:
+        # A partial file would only fail later in metrics with a less useful error
+        path.unlink(missing_ok=True)
+        if logger:
+            logger.error("Failed to save %s.feather: %s", name, e, exc_info=True)
+        raise
+
+# Helper: appending files whose Arrow types differ (e.g. int in one FY, string in another)
+# yields object columns with mixed values, which Arrow cannot write; store only those as strings
+def _stringify_mixed_columns(df: pd.DataFrame) -> pd.DataFrame:
+    mixed = [col for col, dtype in df.dtypes.items() if dtype == object and not _arrow_writable(df[col])]
+    if not mixed:
+        return df
+    return df.assign(**{
+        col: df[col].map(str, na_action="ignore").astype(pd.ArrowDtype(pa.string()))
+        for col in mixed
+    })
+
+def _arrow_writable(series: pd.Series) -> bool:
+    try:
+        pa.array(series, from_pandas=True)
+        return True
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return False
\ No newline at end of file
@@ -1,12 +1,16 @@
+import pandas as pd
 from common.config_loader import load_config
 from common.logger import configure_logger
 from common.path_utils import resolve_output_path
 from common.io_utils import export_summary_json
 from .preprocess_validator import validate_config_paths, validate_data_sources
-from .preprocess_io import ingest_dataframes, save_pickle_files
-from .preprocess_transform import rename_columns, append_dataframes_by_folder
+from .preprocess_io import ingest_dataframes, save_feather_files
+from .preprocess_transform import rename_columns, downcast_numeric_columns, append_dataframes_by_folder, categorize_string_columns
 from .preprocess_summary import assemble_preprocessing_metadata, build_preprocessing_summary
 
+# Defer copies of shared column blocks until a stage actually writes to them
+pd.set_option("mode.copy_on_write", True)
+
 
 def preprocess(config_path: str, output_path: str = None, summary_path: str = None):
     # 1. Load configuration and set up logger
@@ -14,19 +18,27 @@ def preprocess(config_path: str, output_path: str = None, summary_path: str = No
     logger = configure_logger(config=config)
 
     # 2. Validate config paths and data sources
-    validate_config_paths(config_path, logger)
-    validate_data_sources(config_path, logger)
+    validate_config_paths(config, logger)
+    validate_data_sources(config, logger)
 
     # 3. Run preprocessing pipeline
     raw_dict, load_summary = ingest_dataframes(config, logger)
     rename_dict, rename_summary = rename_columns(config, raw_dict, logger)
+    rename_dict = downcast_numeric_columns(config, rename_dict, logger)
     appended_dict, appended_summary = append_dataframes_by_folder(config, rename_dict, logger)
+    appended_dict = categorize_string_columns(config, appended_dict, logger)
 
     # 4. Resolve output directory
     output_dir = resolve_output_path(stage ="preprocess", output_path = output_path, config=config, logger=logger)
 
-    # 5. Export each appended DataFrame to pickle
-    save_pickle_files(appended_dict, output_dir, logger)
+    # 5. Export each appended DataFrame to Feather
+    save_feather_files(
+        appended_dict,
+        output_dir,
+        logger,
+        compression=config.get("feather_compression", "uncompressed"),
+        max_workers=config.get("workers", 4)
+    )
 
     # 6.  Prepare metadata
     metadata_raw = assemble_preprocessing_metadata(appended_dict, load_summary, rename_summary, appended_summary)
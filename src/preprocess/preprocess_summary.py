@@ -1,6 +1,18 @@
 import pandas as pd
 from typing import Dict, List, Any
 
+# Per-folder keys reported in the initial load and append sections of the summary
+_INIT_KEYS = ("folder", "file_count", "total_raw_rows", "total_memory")
+_APPEND_KEYS = (
+    "folder",
+    "appended_rows",
+    "appended_columns",
+    "unexpected_columns_added",
+    "unexpected_columns",
+    "skipped_due_to_mismatch",
+    "append_error"
+)
+
 def assemble_preprocessing_metadata(
     preprocess_dict: Dict[str, pd.DataFrame],
     load_summary: List[Dict[str, Any]],
@@ -10,7 +22,9 @@ def assemble_preprocessing_metadata(
     """
     Combines input summaries and row/column counts into a unified preprocessing metadata dictionary.
     """
-    combined_df = pd.concat(list(preprocess_dict.values()), ignore_index=True)
+    # Dimensions of the stacked output, read from frame metadata instead of concatenating every frame
+    total_rows = sum(df.shape[0] for df in preprocess_dict.values())
+    total_columns = len(set().union(*(df.columns for df in preprocess_dict.values())))
 
     metadata = {
         "load_summary": [
@@ -31,8 +45,8 @@ def assemble_preprocessing_metadata(
             for folder, stats in load_summary.items()
         ],
         "rename_summary": rename_summary,
-        "total_rows": combined_df.shape[0],
-        "total_columns": combined_df.shape[1]
+        "total_rows": total_rows,
+        "total_columns": total_columns
     }
 
     return metadata
@@ -46,37 +60,24 @@ def build_preprocessing_summary(
     """
     folder_stats = preprocess_metadata.get("load_summary", [])
 
+    # One pass over the folder stats fills both the load and append views
+    init_rows, append_rows = [], []
+    for fs in folder_stats:
+        init_rows.append({k: fs.get(k) for k in _INIT_KEYS})
+        append_rows.append({k: fs.get(k) for k in _APPEND_KEYS})
+
     summary = {
         "initial_load": {
-            "initial_folder_stats": [
-                {
-                    "folder": fs.get("folder"),
-                    "file_count": fs.get("file_count"),
-                    "total_raw_rows": fs.get("total_raw_rows"),
-                    "total_memory": fs.get("total_memory")
-                }
-                for fs in folder_stats
-            ]
+            "initial_folder_stats": init_rows
         },
         "preprocessing": {
             "columns_renamed": preprocess_metadata.get("rename_summary", {})
         },
         "appended": {
-            "folder_summaries": [
-                {
-                    "folder": fs.get("folder"),
-                    "appended_rows": fs.get("appended_rows"),
-                    "appended_columns": fs.get("appended_columns"),
-                    "unexpected_columns_added": fs.get("unexpected_columns_added"),
-                    "unexpected_columns": fs.get("unexpected_columns"),
-                    "skipped_due_to_mismatch": fs.get("skipped_due_to_mismatch"),
-                    "append_error": fs.get("append_error")
-                }
-                for fs in folder_stats
-            ],
+            "folder_summaries": append_rows,
             "total_rows": preprocess_metadata.get("total_rows"),
             "total_columns": preprocess_metadata.get("total_columns")
         }
     }
 
-    return summary
\ No newline at end of file
+    return summary
@@ -1,4 +1,6 @@
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Dict, Tuple, List, Any, Optional
 import logging
 
@@ -30,28 +32,62 @@ def rename_columns(
         logger.info(f"Applying {len(rename_map)} column renaming rules...")
     renamed_dict = {}
     rename_summary = {}
+    rename_items = tuple(rename_map.items())
 
     for folder, files in raw_dict.items():
         renamed_dict[folder] = {}
         for file_name, df in files.items():
-            original = df.columns.tolist()
-            renamed_df = df.rename(columns=rename_map)
-            updated = renamed_df.columns.tolist()
+            # Only the rules whose source column exists in this file
+            to_rename = {old: new for old, new in rename_items if old in df.columns}
 
-            changes = [
-                f"{col} -> {rename_map[col]}"
-                for col in rename_map
-                if col in original and rename_map[col] in updated
-            ]
+            if not to_rename:
+                renamed_dict[folder][file_name] = df
+                continue
 
-            if changes and logger:
-                logger.info(f"[{file_name}] Renamed columns: {', '.join(changes)}")
-                rename_summary[file_name] = changes
+            renamed_dict[folder][file_name] = df.rename(columns=to_rename)
+            changes = [f"{old} -> {new}" for old, new in to_rename.items()]
 
-            renamed_dict[folder][file_name] = renamed_df
+            if logger:
+                logger.info(f"[{file_name}] Renamed columns: {', '.join(changes)}")
+            rename_summary[file_name] = changes
 
     return renamed_dict, rename_summary
 
+# Numeric Downcasting
+def downcast_numeric_columns(
+    config: dict,
+    dataframes: Dict[str, Dict[str, pd.DataFrame]],
+    logger: Optional[logging.Logger] = None
+) -> Dict[str, Dict[str, pd.DataFrame]]:
+    """
+    Narrows integer columns to the smallest integer dtype that holds their values
+    when config['downcast_numeric'] is enabled, so append, merge and dedupe touch fewer bytes.
+    Float columns keep full width to preserve the precision of cost/funding values.
+    """
+    if not config.get("downcast_numeric", False):
+        return dataframes
+
+    if logger:
+        logger.info("Downcasting integer columns...")
+
+    downcast_dict = {}
+    for folder, files in dataframes.items():
+        downcast_dict[folder] = {}
+        for file_name, df in files.items():
+            int_cols = [col for col, dtype in df.dtypes.items() if pd.api.types.is_integer_dtype(dtype)]
+            if not int_cols:
+                downcast_dict[folder][file_name] = df
+                continue
+
+            # assign builds a new frame, leaving the caller's (and raw_dict's) frames untouched
+            downcast_dict[folder][file_name] = df.assign(
+                **{col: pd.to_numeric(df[col], downcast="integer") for col in int_cols}
+            )
+            if logger:
+                logger.debug(f"[{file_name}] Downcast {len(int_cols)} integer column(s)")
+
+    return downcast_dict
+
 # Folder-wise DataFrame Appending
 def append_dataframes_by_folder(
     config: dict,
@@ -61,51 +97,77 @@ def append_dataframes_by_folder(
     """
     Appends all DataFrames within each folder into a single stacked DataFrame.
     Also summarizes column consistency and row/column statistics.
+    Folders are independent, so they are appended concurrently when config['parallel'] is set.
     Returns both the appended DataFrames and the summary dictionary.
     """
     force_append = config.get("force_append", False)
+    use_parallel = config.get("parallel", False)
+    max_workers = config.get("workers", 4)
     appended_dict = {}
     summary_dict = {}
 
-    for folder, dfs in dataframes.items():
-        summary = _initialize_folder_summary(folder, len(dfs))
-
-        try:
-            all_columns = {col for df in dfs.values() for col in df.columns}
-            common_columns = set.intersection(*(set(df.columns) for df in dfs.values()))
-            unexpected = sorted(all_columns - common_columns)
-
-            summary["unexpected_columns"] = unexpected
-            summary["unexpected_columns_added"] = len(unexpected)
+    task = partial(_append_folder, force_append=force_append, logger=logger)
 
-            if unexpected and not force_append:
-                if logger:
-                    logger.warning(f"Column mismatch in '{folder}': {unexpected}")
-                    logger.info(f"Skipping append for '{folder}' due to mismatch.")
-                summary["skipped"] = True
-                summary_dict[folder] = summary
-                continue
+    if use_parallel:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(task, dataframes.keys(), dataframes.values()))
+    else:
+        results = [task(folder, dfs) for folder, dfs in dataframes.items()]
 
-            appended_df = pd.concat(list(dfs.values()), ignore_index=True)
+    for folder, appended_df, summary in results:
+        if appended_df is not None:
             appended_dict[folder] = appended_df
+        summary_dict[folder] = summary
 
-            summary["total_rows"] = appended_df.shape[0]
-            summary["total_columns"] = appended_df.shape[1]
+    return appended_dict, summary_dict
 
+# Helper: Append a single folder
+def _append_folder(
+    folder: str,
+    dfs: Dict[str, pd.DataFrame],
+    force_append: bool,
+    logger: Optional[logging.Logger] = None
+) -> Tuple[str, Optional[pd.DataFrame], Dict[str, Any]]:
+    summary = _initialize_folder_summary(folder, len(dfs))
+    appended_df = None
+
+    try:
+        frames = list(dfs.values())
+        ref_columns = tuple(frames[0].columns) if frames else ()
+        # Fast path: identical headers in the same order need no set arithmetic
+        if all(tuple(df.columns) == ref_columns for df in frames[1:]):
+            unexpected = []
+        else:
+            column_sets = [set(df.columns) for df in frames]
+            unexpected = sorted(set().union(*column_sets) - set.intersection(*column_sets))
+
+        summary["unexpected_columns"] = unexpected
+        summary["unexpected_columns_added"] = len(unexpected)
+
+        if unexpected and not force_append:
             if logger:
-                logger.info(
-                    f"Appended {summary['num_files']} files in '{folder}': "
-                    f"{summary['total_rows']:,} rows, {summary['total_columns']:,} columns."
-                )
+                logger.warning(f"Column mismatch in '{folder}': {unexpected}")
+                logger.info(f"Skipping append for '{folder}' due to mismatch.")
+            summary["skipped"] = True
+            return folder, None, summary
 
-        except Exception as e:
-            summary["error"] = str(e)
-            if logger:
-                logger.error(f"Error in folder '{folder}': {str(e)}", exc_info=True)
+        appended_df = pd.concat(frames, ignore_index=True)
 
-        summary_dict[folder] = summary
+        summary["total_rows"] = appended_df.shape[0]
+        summary["total_columns"] = appended_df.shape[1]
 
-    return appended_dict, summary_dict
+        if logger:
+            logger.info(
+                f"Appended {summary['num_files']} files in '{folder}': "
+                f"{summary['total_rows']:,} rows, {summary['total_columns']:,} columns."
+            )
+
+    except Exception as e:
+        summary["error"] = str(e)
+        if logger:
+            logger.error(f"Error in folder '{folder}': {str(e)}", exc_info=True)
+
+    return folder, appended_df, summary
 
 # Helper: Folder Summary
 def _initialize_folder_summary(folder: str, num_files: int) -> Dict[str, Any]:
@@ -119,3 +181,34 @@ def _initialize_folder_summary(folder: str, num_files: int) -> Dict[str, Any]:
         "total_columns": 0,
         "error": None
     }
+
+# Low-cardinality String Columns to Categorical
+def categorize_string_columns(
+    config: dict,
+    appended_dict: Dict[str, pd.DataFrame],
+    logger: Optional[logging.Logger] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    Converts string columns of each appended DataFrame to category dtype when their distinct
+    count is below config['auto_categorical_threshold'] times the row count.
+    Repeated values are then stored once, shrinking the frame and its Feather output.
+    """
+    threshold = config.get("auto_categorical_threshold")
+    if not threshold:
+        return appended_dict
+
+    if logger:
+        logger.info(f"Converting string columns below {threshold:.0%} distinct values to categorical...")
+
+    for folder, df in appended_dict.items():
+        max_unique = threshold * len(df)
+        cat_cols = [
+            col for col, dtype in df.dtypes.items()
+            if pd.api.types.is_string_dtype(dtype) and df[col].nunique(dropna=False) < max_unique
+        ]
+        if cat_cols:
+            appended_dict[folder] = df.astype({col: "category" for col in cat_cols})
+            if logger:
+                logger.debug(f"[{folder}] Categorized {len(cat_cols)} column(s): {', '.join(cat_cols)}")
+
+    return appended_dict
@@ -1,11 +1,10 @@
 import logging
 from pathlib import Path
-from common.config_loader import load_config
 from typing import Optional
+from .preprocess_io import list_csv_files
 
-def validate_config_paths(config_path: str, logger: Optional[logging.Logger]) -> None:
+def validate_config_paths(config: dict, logger: Optional[logging.Logger]) -> None:
     """Check for suspicious or absolute paths in config folder field."""
-    config = load_config(config_path)
     folder_raw = config.get("folder", "")
     folder_path = Path(folder_raw)
 
@@ -23,12 +22,15 @@ def validate_config_paths(config_path: str, logger: Optional[logging.Logger]) ->
             "relative paths help ensure portability."
         )
 
-def validate_data_sources(config_path: str, logger: Optional[logging.Logger]) -> None:
-    """Confirm subfolders exist and contain CSV files."""
-    config = load_config(config_path)
+def validate_data_sources(config: dict, logger: Optional[logging.Logger]) -> None:
+    """
+    Confirm subfolders exist and contain CSV files.
+    The listing is kept in config['_csv_index'] so ingestion does not scan the folders again.
+    """
     project_root = Path(__file__).resolve().parents[2]
     data_root = project_root / config.get("folder", "")
     subfolders = config.get("subfolders", [])
+    csv_index = config.setdefault("_csv_index", {})
 
     logger.info("Validating data sources...\n")
 
@@ -38,7 +40,8 @@ def validate_data_sources(config_path: str, logger: Optional[logging.Logger]) ->
             logger.warning(f"Missing folder: {folder_path.resolve()}")
             continue
 
-        csv_files = list(folder_path.glob("*.csv"))
+        csv_files = list_csv_files(folder_path)
+        csv_index[subfolder] = csv_files
         if not csv_files:
             logger.warning(f"Folder contains no CSVs: {folder_path.resolve()}")
         else:
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# Add src as project root to Python path, as bin/cli.py does
+src_path = Path(__file__).resolve().parent.parent / "src"
+sys.path.append(str(src_path))
@@ -0,0 +1,24 @@
+import pandas as pd
+
+from keywords.keywords_keywords_enrichment import enrich_with_keyword_metrics
+
+
+def _frame():
+    return pd.DataFrame({
+        "PROJECT_TITLE": ["Aspirin for Asthma", "asthma cohort", None, "Statins and aspirin"],
+        "ABSTRACT_TEXT": ["aspirin again", "", "no terms here", "Diabetes"],
+    })
+
+
+def test_parallel_matches_sequential():
+    treatments, diseases = ["aspirin", "statins"], ["asthma", "diabetes"]
+    base = {"text_columns": ["PROJECT_TITLE", "ABSTRACT_TEXT"], "workers": 2}
+
+    sequential, seq_summary = enrich_with_keyword_metrics(_frame(), {**base, "parallel": False}, treatments, diseases)
+    parallel, par_summary = enrich_with_keyword_metrics(_frame(), {**base, "parallel": True}, treatments, diseases)
+
+    pd.testing.assert_frame_equal(parallel, sequential)
+    assert par_summary == seq_summary
+    assert sequential["total count"].tolist() == [3, 1, 0, 3]
+    assert sequential["total unique count"].tolist() == [2, 1, 0, 3]
+    assert sequential["flagged"].tolist()[0] == ["aspirin", "asthma"]
@@ -0,0 +1,18 @@
+import logging
+
+from common.logger import configure_logger
+
+
+def test_reconfigure_flushes_and_closes_buffered_file_target(tmp_path):
+    config = {"logs_dir": str(tmp_path), "log_to_console": False, "log_buffer_capacity": 100}
+    logger = configure_logger(name="test_buffered", config=config)
+    memory_handler = logger.handlers[0]
+    file_handler = memory_handler.target
+    logger.info("buffered record")
+
+    configure_logger(name="test_buffered", config=config, file_mode="a")
+
+    assert isinstance(file_handler, logging.FileHandler)
+    assert file_handler.stream is None
+    log_text = "".join(path.read_text(encoding="utf-8") for path in tmp_path.glob("*.log"))
+    assert "buffered record" in log_text
@@ -0,0 +1,35 @@
+import pandas as pd
+import pyarrow as pa
+
+from metrics.metrics_aggregate import aggregate_project_outputs, count_unique_pairs
+
+_ARROW_STRING = pd.ArrowDtype(pa.string())
+
+
+def test_count_unique_pairs_reports_exact_duplicates():
+    df = pd.DataFrame({
+        "PROJECT_NUMBER": ["P1", "P1", "P1", "P2", None, None],
+        "PMID": ["1", "1", "2", "1", "3", "3"],
+    })
+
+    projects, summary = count_unique_pairs(df, ["PROJECT_NUMBER", "PMID"], "publication count")
+
+    assert sorted(projects.dropna().tolist()) == ["P1", "P1", "P2"]
+    assert len(projects) == 4
+    assert summary == {
+        "publication count": {"unique_duplicate_rows": 2, "total_duplicates": 4, "extra_duplicates": 2}
+    }
+
+
+def test_publication_counts_align_to_project_rows():
+    prj = pd.DataFrame({"PROJECT_NUMBER": pd.Series(["P1", "P2", "P3", "P1", None], dtype=_ARROW_STRING)})
+    publink = pd.DataFrame({
+        "PROJECT_NUMBER": ["p1 ", "P1", "P1", "P2", None],
+        "PMID": [10, 10, 11, 10, 12],
+    })
+
+    aggregate_df, summary = aggregate_project_outputs({"PRJ_PRJABS": prj}, {"PUBLINK": publink})
+
+    # Repeated project rows share one count; unmatched and null project numbers count zero
+    assert aggregate_df["publication count"].tolist() == [2, 1, 0, 2, 0]
+    assert summary["publication count"]["extra_duplicates"] == 1
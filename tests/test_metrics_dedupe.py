@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+from metrics import metrics_dedupe
+from metrics.metrics_dedupe import remove_true_duplicates_from_df
+
+
+def _counts(summary):
+    return summary["Aggregate_output"]
+
+
+def test_rows_differing_only_by_null_are_kept():
+    df = pd.DataFrame({"APPLICATION_ID": [1, 1, 1], "PHR": ["a", None, None]})
+
+    deduped, summary = remove_true_duplicates_from_df(df)
+
+    assert deduped["PHR"].tolist()[:1] == ["a"]
+    assert len(deduped) == 2
+    assert _counts(summary) == {"unique_duplicate_rows": 1, "total_duplicates": 2, "extra_duplicates": 1}
+
+
+def test_list_valued_cells_are_compared_exactly():
+    df = pd.DataFrame({"APPLICATION_ID": [1, 1, 1], "flagged": [["a", "b"], ["a", "b"], ["b", "a"]]})
+
+    deduped, summary = remove_true_duplicates_from_df(df)
+
+    assert deduped["flagged"].tolist() == [["a", "b"], ["b", "a"]]
+    assert _counts(summary)["extra_duplicates"] == 1
+
+
+def test_subset_compares_key_columns_only():
+    df = pd.DataFrame({"APPLICATION_ID": [1, 1, 2], "PHR": ["a", "b", "c"]})
+
+    full, _ = remove_true_duplicates_from_df(df)
+    keyed, summary = remove_true_duplicates_from_df(df, subset=["APPLICATION_ID"])
+
+    assert len(full) == 3
+    assert keyed["PHR"].tolist() == ["a", "c"]
+    assert _counts(summary) == {"unique_duplicate_rows": 1, "total_duplicates": 2, "extra_duplicates": 1}
+
+
+def test_missing_subset_column_falls_back_to_full_rows():
+    df = pd.DataFrame({"APPLICATION_ID": [1, 1], "PHR": ["a", "b"]})
+
+    deduped, _ = remove_true_duplicates_from_df(df, subset=["APPLICATION_ID", "NOT_A_COLUMN"])
+
+    assert len(deduped) == 2
+
+
+def test_hash_collisions_do_not_drop_distinct_rows(monkeypatch):
+    # Force every row into one hash group; only the exact comparison may decide
+    monkeypatch.setattr(
+        metrics_dedupe,
+        "_hash_rows",
+        lambda frame: pd.Series(np.zeros(len(frame), dtype=np.uint64), index=frame.index)
+    )
+    df = pd.DataFrame({"APPLICATION_ID": [1, 2, 2, 3]})
+
+    deduped, summary = remove_true_duplicates_from_df(df)
+
+    assert deduped["APPLICATION_ID"].tolist() == [1, 2, 3]
+    assert _counts(summary) == {"unique_duplicate_rows": 1, "total_duplicates": 2, "extra_duplicates": 1}
+
+
+def test_categorical_nulls_are_not_duplicates_of_values():
+    df = pd.DataFrame({
+        "APPLICATION_ID": [1002, 1002],
+        "ACTIVITY": pd.Categorical(["R01", None])
+    })
+
+    deduped, summary = remove_true_duplicates_from_df(df)
+
+    assert len(deduped) == 2
+    assert _counts(summary)["total_duplicates"] == 0
@@ -0,0 +1,55 @@
+import pandas as pd
+import pyarrow as pa
+
+from metrics.metrics_dedupe import remove_true_duplicates_from_df
+from metrics.metrics_io import load_feather_dataframes
+from preprocess.preprocess_io import save_feather_files
+from preprocess.preprocess_transform import categorize_string_columns
+
+ARROW_STRING = pd.ArrowDtype(pa.string())
+
+
+def _round_trip(appended_dict, tmp_path):
+    save_feather_files(appended_dict, tmp_path)
+    return load_feather_dataframes({name: tmp_path / f"{name}.feather" for name in appended_dict})
+
+
+def test_categorized_columns_with_nulls_survive_round_trip_and_dedupe(tmp_path):
+    prj = pd.DataFrame({
+        "APPLICATION_ID": pd.array([1001, 1002, 1002], dtype=pd.ArrowDtype(pa.int64())),
+        "ACTIVITY": pd.array(["R01", "R01", None], dtype=ARROW_STRING)
+    })
+    appended = categorize_string_columns({"auto_categorical_threshold": 0.9}, {"PRJ": prj})
+
+    loaded = _round_trip(appended, tmp_path)["PRJ"]
+    deduped, summary = remove_true_duplicates_from_df(loaded)
+
+    assert isinstance(loaded["ACTIVITY"].dtype, pd.CategoricalDtype)
+    assert loaded["ACTIVITY"].isna().tolist() == [False, False, True]
+    assert len(deduped) == 3
+    assert summary["Aggregate_output"]["total_duplicates"] == 0
+
+
+def test_feather_round_trip_keeps_strings_categories_and_lists(tmp_path):
+    prj = pd.DataFrame({
+        "PROJECT_TITLE": pd.array(["Gene editing", None], dtype=ARROW_STRING),
+        "ACTIVITY": pd.Categorical(["R01", None]),
+        "flagged": pd.array([["crispr"], []], dtype=pd.ArrowDtype(pa.list_(pa.string())))
+    })
+
+    loaded = _round_trip({"PRJ": prj}, tmp_path)["PRJ"]
+
+    assert loaded["PROJECT_TITLE"].dtype == ARROW_STRING
+    assert isinstance(loaded["ACTIVITY"].dtype, pd.CategoricalDtype)
+    assert loaded["flagged"].dtype == pd.ArrowDtype(pa.list_(pa.string()))
+    assert loaded["flagged"].tolist() == [["crispr"], []]
+
+
+def test_mixed_type_object_columns_are_saved_as_strings(tmp_path):
+    prj = pd.DataFrame({"APPLICATION_ID": pd.Series([1001, "1002", None], dtype=object)})
+
+    loaded = _round_trip({"PRJ": prj}, tmp_path)["PRJ"]
+
+    assert loaded["APPLICATION_ID"].dtype == ARROW_STRING
+    assert loaded["APPLICATION_ID"].tolist()[:2] == ["1001", "1002"]
+    assert loaded["APPLICATION_ID"].isna().tolist() == [False, False, True]
@@ -0,0 +1,27 @@
+import pandas as pd
+
+from metrics.metrics_merge import merge_linked_dataframes
+
+
+def test_prj_prjabs_join_on_normalized_application_id():
+    prj = pd.DataFrame({"APPLICATION_ID": [" 1001", "a1002", "1003"], "PROJECT_TITLE": ["x", "y", "z"]})
+    prjabs = pd.DataFrame({"APPLICATION_ID": ["1001", "A1002 ", "A1002"], "ABSTRACT_TEXT": ["p", "q", "r"]})
+
+    linked, summary = merge_linked_dataframes({"PRJ": prj, "PRJABS": prjabs})
+
+    joined = linked["PRJ_PRJABS"]
+    assert joined.columns.tolist() == ["APPLICATION_ID", "PROJECT_TITLE", "ABSTRACT_TEXT"]
+    # Left join keeps PRJ order; duplicated abstracts fan out and unmatched projects keep a null abstract
+    assert joined["APPLICATION_ID"].tolist() == ["1001", "A1002", "A1002", "1003"]
+    assert joined["ABSTRACT_TEXT"].tolist()[:3] == ["p", "q", "r"]
+    assert pd.isna(joined["ABSTRACT_TEXT"].iloc[3])
+    assert summary["PRJ_PRJABS"]["changes"] == {"rows_added": 1, "cols_added": 1}
+
+
+def test_missing_source_skips_merge():
+    prj = pd.DataFrame({"APPLICATION_ID": ["1001"]})
+
+    linked, summary = merge_linked_dataframes({"PRJ": prj})
+
+    assert linked == {}
+    assert summary == {}
@@ -0,0 +1,77 @@
+import pandas as pd
+import pyarrow as pa
+
+from preprocess.preprocess_io import load_csv_files, read_csv_file
+
+BOM = b"\xef\xbb\xbf"
+ARROW_STRING = pd.ArrowDtype(pa.string())
+
+
+def _write_csv(path, text, bom=False):
+    path.write_bytes((BOM if bom else b"") + text.encode("latin1"))
+    return path
+
+
+def test_column_types_apply_to_bom_prefixed_first_column(tmp_path):
+    csv_path = _write_csv(tmp_path / "FY2022.csv", "APPLICATION_ID,FY\n101,2022\n102,2022\n", bom=True)
+
+    df = read_csv_file(csv_path, column_types={"APPLICATION_ID": pa.string()})
+
+    assert list(df.columns) == ["APPLICATION_ID", "FY"]
+    assert df["APPLICATION_ID"].dtype == ARROW_STRING
+    assert df["APPLICATION_ID"].tolist() == ["101", "102"]
+
+
+def test_subfolder_column_types_match_with_and_without_bom(tmp_path):
+    folder = tmp_path / "PRJ"
+    folder.mkdir()
+    _write_csv(folder / "FY2022.csv", "APPLICATION_ID,FY\n101,2022\n", bom=True)
+    _write_csv(folder / "FY2023.csv", "APPLICATION_ID,FY\n201,2023\n")
+
+    loaded = load_csv_files(
+        logger=None,
+        main_folder=str(tmp_path),
+        subfolders=["PRJ"],
+        folder_column_types={"PRJ": {"APPLICATION_ID": pa.string()}}
+    )
+
+    dtypes = {name: df["APPLICATION_ID"].dtype for name, df in loaded["PRJ"].items()}
+    assert dtypes == {"FY2022": ARROW_STRING, "FY2023": ARROW_STRING}
+
+
+
+def test_csv_cache_is_reused_and_keyed_on_parse_options(tmp_path, monkeypatch):
+    from preprocess import preprocess_io
+
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    csv_path = _write_csv(tmp_path / "X.csv", "APPLICATION_ID,FY\n101,2022\n")
+    _write_csv(tmp_path / "X-new.csv", "APPLICATION_ID,FY\n201,2023\n")
+
+    first = read_csv_file(csv_path, cache_dir=cache_dir)
+    read_csv_file(tmp_path / "X-new.csv", cache_dir=cache_dir)
+    assert len(list(cache_dir.iterdir())) == 2
+
+    # A cache hit never reaches the CSV parser
+    def fail(*args, **kwargs):
+        raise AssertionError("parsed instead of using the cache")
+    monkeypatch.setattr(preprocess_io, "_read_csv_arrow", fail)
+    pd.testing.assert_frame_equal(read_csv_file(csv_path, cache_dir=cache_dir), first)
+    monkeypatch.undo()
+
+    # Other parse options get their own key and replace the stale X entry, leaving X-new alone
+    typed = read_csv_file(csv_path, cache_dir=cache_dir, column_types={"APPLICATION_ID": pa.string()})
+    assert typed["APPLICATION_ID"].dtype == ARROW_STRING
+    assert len(list(cache_dir.iterdir())) == 2
+    assert any(p.name.startswith(f"{tmp_path.name}__X-new-") for p in cache_dir.iterdir())
+    assert sum(p.name.rsplit("-", 3)[0] == f"{tmp_path.name}__X" for p in cache_dir.iterdir()) == 1
+
+
+def test_short_rows_fall_back_to_pandas_and_are_kept(tmp_path):
+    csv_path = _write_csv(tmp_path / "FY2022.csv", "APPLICATION_ID,FY,PHR\n101,2022,a\n102,2022\n")
+
+    df = read_csv_file(csv_path)
+
+    assert len(df) == 2
+    assert df["APPLICATION_ID"].tolist() == [101, 102]
+    assert pd.isna(df["PHR"].iloc[1])
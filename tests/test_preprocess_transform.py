@@ -0,0 +1,46 @@
+import pandas as pd
+
+from preprocess.preprocess_transform import categorize_string_columns, downcast_numeric_columns
+
+
+def test_downcast_returns_new_frames_and_leaves_input_untouched():
+    raw = pd.DataFrame({"FY": [2022, 2023], "TOTAL_COST": [1.5, 2.5]})
+    dataframes = {"PRJ": {"FY2022": raw}}
+
+    result = downcast_numeric_columns({"downcast_numeric": True}, dataframes)
+
+    downcast = result["PRJ"]["FY2022"]
+    assert downcast is not raw
+    assert downcast["FY"].dtype == "int16"
+    assert downcast["TOTAL_COST"].dtype == "float64"
+    assert raw["FY"].dtype == "int64"
+    assert dataframes["PRJ"]["FY2022"] is raw
+
+
+def test_downcast_disabled_returns_input():
+    dataframes = {"PRJ": {"FY2022": pd.DataFrame({"FY": [2022]})}}
+
+    assert downcast_numeric_columns({}, dataframes) is dataframes
+
+
+def test_categorize_converts_only_low_cardinality_string_columns():
+    df = pd.DataFrame({
+        "ACTIVITY": ["R01", "R01", "R01", "R21"],
+        "PROJECT_TITLE": ["a", "b", "c", "d"],
+        "FY": [2022, 2022, 2022, 2022]
+    })
+    appended = {"PRJ": df}
+
+    result = categorize_string_columns({"auto_categorical_threshold": 0.6}, appended)
+
+    dtypes = result["PRJ"].dtypes
+    assert isinstance(dtypes["ACTIVITY"], pd.CategoricalDtype)
+    assert dtypes["PROJECT_TITLE"] == object
+    assert dtypes["FY"] == "int64"
+    assert df["ACTIVITY"].dtype == object
+
+
+def test_categorize_disabled_returns_input():
+    appended = {"PRJ": pd.DataFrame({"ACTIVITY": ["R01", "R01"]})}
+
+    assert categorize_string_columns({}, appended) is appended
@@ -1,7 +1,7 @@
 rule metrics:
     input:
         config = "config/config.yaml",
-        pickles = config["preprocess_dir"]
+        frames = config["preprocess_dir"]
     output:
         metrics_dir = directory(config['metrics_dir']),
         summary = str(Path(config['metrics_dir']) / "metrics_summary.json")
@@ -12,7 +12,7 @@ rule metrics:
     shell:
         """
         python bin/cli.py metrics \
-            --pickles {input.pickles} \
+            --frames {input.frames} \
             --config {input.config} \
             --output {output.metrics_dir} \
             --summary-json {output.summary} \